@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Portable pre-extracted monuments dataset: file format and bulk loader.
+
+A dataset file is gzip-compressed JSON lines. The first line is a header:
+
+    {"format": "patrimoniu-monuments", "version": 1, "columns": [...],
+     "rows": 12345, "sha256": "...", "created_at": "..."}
+
+followed by one JSON array per monument, in header column order. sha256 covers
+all row lines (including their newlines) and is verified on load.
+
+Create a dataset with `python import_pdfs.py --export FILE` and load it with:
+
+    python dataset.py FILE [--database-url URL]
+
+PostgreSQL is loaded with COPY, other databases with executemany. The load
+replaces the contents of the monuments table in a single transaction, holding
+an import job slot (see import_jobs.py) so it never overlaps another import.
+"""
+
+import argparse
+import csv
+import gzip
+import hashlib
+import io
+import json
+import sys
+import time
+import traceback
+from datetime import datetime
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from models import Monument, init_db
+from env import DATABASE_URL_LOCAL
+
+DATASET_FORMAT = "patrimoniu-monuments"
+DATASET_VERSION = 1
+COLUMNS = [column.name for column in Monument.__table__.columns]
+
+INSERT_CHUNK_SIZE = 5000
+
+
+class DatasetError(Exception):
+    """Raised when a dataset file is malformed, unsupported or fails its checksum."""
+
+
+def write_dataset(path, rows: list) -> str:
+    """Write monument dicts to a dataset file and return its checksum."""
+    lines = [
+        (json.dumps([row.get(column) for column in COLUMNS], ensure_ascii=False) + "\n").encode("utf-8")
+        for row in rows
+    ]
+    checksum = hashlib.sha256(b"".join(lines)).hexdigest()
+    header = {
+        "format": DATASET_FORMAT,
+        "version": DATASET_VERSION,
+        "columns": COLUMNS,
+        "rows": len(lines),
+        "sha256": checksum,
+        "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+    }
+    with gzip.open(path, "wb") as f:
+        f.write((json.dumps(header) + "\n").encode("utf-8"))
+        f.writelines(lines)
+    return checksum
+
+
+def read_dataset(path) -> tuple:
+    """Read and verify a dataset file. Returns (header, rows as dicts keyed by COLUMNS)."""
+    with gzip.open(path, "rb") as f:
+        try:
+            header = json.loads(f.readline())
+        except ValueError:
+            raise DatasetError(f"{path}: missing or invalid header")
+        if header.get("format") != DATASET_FORMAT:
+            raise DatasetError(f"{path}: not a {DATASET_FORMAT} dataset")
+        if header.get("version", 0) > DATASET_VERSION:
+            raise DatasetError(f"{path}: unsupported dataset version {header['version']}")
+        lines = f.readlines()
+
+    if hashlib.sha256(b"".join(lines)).hexdigest() != header.get("sha256"):
+        raise DatasetError(f"{path}: checksum mismatch")
+    if len(lines) != header.get("rows"):
+        raise DatasetError(f"{path}: expected {header.get('rows')} rows, found {len(lines)}")
+
+    # Columns missing from older dataset versions load as NULL
+    columns = header["columns"]
+    rows = []
+    for line in lines:
+        values = dict(zip(columns, json.loads(line)))
+        rows.append({column: values.get(column) for column in COLUMNS})
+    return header, rows
+
+
+def copy_rows_postgres(connection, rows: list) -> None:
+    """Bulk-load rows with COPY ... FROM STDIN (psycopg2)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(["\\N" if row[column] is None else row[column] for column in COLUMNS])
+    buffer.seek(0)
+
+    cursor = connection.connection.cursor()
+    cursor.copy_expert(
+        f"COPY monuments ({', '.join(COLUMNS)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+        buffer,
+    )
+
+
+def load_dataset(engine, path) -> int:
+    """Replace the monuments table contents with a dataset file. Returns the row count.
+
+    Raises ImportAlreadyRunning if an import job is active.
+    """
+    # Imported here: import_jobs -> import_pdfs -> dataset would be circular at module level
+    from import_jobs import Heartbeat, claim_import_job, finish_import_job
+
+    header, rows = read_dataset(path)
+    init_db(engine)
+
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    job_db = SessionLocal()
+    error = None
+    try:
+        job = claim_import_job(job_db)
+        job.status = "running"
+        job_db.commit()
+        try:
+            with Heartbeat(SessionLocal, job.id):
+                # DELETE (not TRUNCATE) so API readers keep seeing the old rows until commit
+                with engine.begin() as connection:
+                    connection.execute(Monument.__table__.delete())
+                    if engine.dialect.name == "postgresql":
+                        copy_rows_postgres(connection, rows)
+                    else:
+                        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+                            connection.execute(insert(Monument.__table__), rows[start:start + INSERT_CHUNK_SIZE])
+        except BaseException:
+            error = traceback.format_exc(limit=5)
+            raise
+        finally:
+            finish_import_job(job_db, job, error)
+    finally:
+        job_db.close()
+
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.exec_driver_sql("ANALYZE monuments")
+    return len(rows)
+
+
+def main():
+    from import_jobs import ImportAlreadyRunning
+
+    parser = argparse.ArgumentParser(description="Load a monuments dataset file into the database.")
+    parser.add_argument("file", help="Dataset file created by import_pdfs.py --export")
+    parser.add_argument("--database-url", default=DATABASE_URL_LOCAL)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    start = time.perf_counter()
+    try:
+        count = load_dataset(engine, args.file)
+    except DatasetError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    except ImportAlreadyRunning:
+        print("Error: An import is already running")
+        sys.exit(1)
+    print(f"Loaded {count} monuments in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Parse the free-text "Datare" column into a numeric year range.
+
+Handles explicit years ("1890 - 1900", "cca. 1900", "1800 - 800 a. Chr."), centuries with optional
+qualifiers and era markers ("sf. sec. XIX", "sec. IV a. Chr. – sec. II p. Chr.",
+"IX - XI") and archaeological periods ("Hallstatt", "Epoca romană"). Years before Christ
+are negative. When a value mentions several dates (e.g. "sec. XVIII, ext. 1820")
+the range covers all of them.
+"""
+
+import re
+import unicodedata
+
+CONFIDENCE_HIGH = "high"  # explicit years
+CONFIDENCE_LOW = "low"    # inferred from centuries, "cca." or archaeological periods
+
+ROMAN_VALUES = {"I": 1, "V": 5, "X": 10}
+
+# Fraction of a century covered by each qualifier
+QUALIFIERS = {
+    "inc": (0.0, 1 / 3),
+    "mijl": (1 / 3, 2 / 3),
+    "sf": (2 / 3, 1.0),
+    "prima jum": (0.0, 0.5),
+    "a doua jum": (0.5, 1.0),
+}
+QUALIFIER = r"(?:(inc|mijl|sf|prima jum|a doua jum)\.?\s*(?:a\s+)?)?"
+# The PDFs sometimes have a lowercase L instead of I ("sec. XlX"); since the text is
+# lowercased before matching, "l" in a numeral is read as I (no century reaches L)
+CENTURY = QUALIFIER + r"(?:sec\.?|secolul)\s*([IVXL]+)\b\.?(?:\s*([ap])\.\s*chr\.?)?"
+CENTURY_END = QUALIFIER + r"(?:(?:sec\.?|secolul)\s*)?([IVXL]+)\b\.?(?:\s*([ap])\.\s*chr\.?)?"
+RANGE_SEPARATOR = r"\s*[-\u2013\u2014]\s*"  # hyphen, en dash or em dash
+CENTURY_RANGE_RE = re.compile(CENTURY + r"(?:" + RANGE_SEPARATOR + CENTURY_END + r")?", re.IGNORECASE)
+# Century range without "sec.", only accepted as a whole comma-separated part of the
+# value ("IX - XI", "III - IV p. Chr.", "sec. XIV - XV, XVI - XVII") to avoid matching
+# stray numerals such as "Microraion III"
+BARE_CENTURY_RANGE_RE = re.compile(CENTURY_END + r"(?:" + RANGE_SEPARATOR + CENTURY_END + r")?", re.IGNORECASE)
+YEAR_RE = re.compile(r"\b(1[0-9]{3}|20[0-9]{2})\b")
+# Years with an era marker ("1800 - 800 a. Chr.", "101 - 118 p. Chr."); as for
+# centuries, a marker on the end applies to both ends. Any length is accepted
+# since the marker makes them unambiguous ("10000 - 5000 a. Chr.")
+ERA_YEAR = r"\b([0-9]{1,5})(?:\s*([ap])\.\s*chr\b\.?)?"
+ERA_YEAR_RANGE_RE = re.compile(
+    ERA_YEAR + r"(?:" + RANGE_SEPARATOR + r"([0-9]{1,5}))?\s*([ap])\.\s*chr\b\.?", re.IGNORECASE
+)
+# A leftover number that could be a year; short ones are usually house numbers
+# bled in from the address column ("nr. 1 1907 - 1908")
+UNPARSED_YEAR_RE = re.compile(r"\b[0-9]{3,5}\b")
+APPROXIMATE_RE = re.compile(r"\b(cca|circa)\b", re.IGNORECASE)
+
+# Approximate spans of archaeological/historical periods in Romania, checked in order
+ERAS = [
+    ("paleolitic", -50000, -10000),
+    ("mezolitic", -10000, -6500),
+    ("eneolitic", -3700, -2500),
+    ("neolitic", -6500, -3700),
+    ("epoca bronzului", -2500, -1150),
+    ("epoca fierului", -1150, 106),
+    ("hallstat", -1150, -450),  # also matches the "Hallstat" misspelling
+    ("latene", -450, 106),
+    ("la tene", -450, 106),
+    ("epoca geto-dacica", -450, 106),
+    ("epoca dacica", -450, 106),
+    ("epoca daco-romana", 106, 400),
+    ("epoca romana", 106, 275),
+    ("epoca migratiilor", 275, 1000),
+    ("epoca romano-bizantina", 275, 700),
+    ("epoca medievala timpurie", 500, 1200),
+    ("epoca medieval timpurie", 500, 1200),
+    ("epoca medievala", 500, 1600),
+    ("evul mediu", 500, 1600),
+]
+
+
+def strip_diacritics(text: str) -> str:
+    """Lowercase and remove diacritics (both ş/ţ cedilla and ș/ț comma forms)."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def roman_to_int(numeral: str) -> int:
+    """Convert a century Roman numeral to an integer, reading "l" as I."""
+    total = 0
+    values = [ROMAN_VALUES[c] for c in numeral.upper().replace("L", "I")]
+    for i, value in enumerate(values):
+        if i + 1 < len(values) and value < values[i + 1]:
+            total -= value
+        else:
+            total += value
+    return total
+
+
+def century_span(century: int, before_christ: bool, qualifier: str = None) -> tuple:
+    """Return the (start, end) years of a century, narrowed by a qualifier like "sf"."""
+    if before_christ:
+        start, end = -century * 100, -(century - 1) * 100 - 1
+    else:
+        start, end = (century - 1) * 100 + 1, century * 100
+    if qualifier:
+        low, high = QUALIFIERS[qualifier]
+        length = end - start
+        start, end = start + round(length * low), start + round(length * high)
+    return start, end
+
+
+def century_range_span(match) -> tuple:
+    """Return the (start, end) span of a CENTURY_RANGE_RE / BARE_CENTURY_RANGE_RE match."""
+    start_qualifier, start_numeral, start_era, end_qualifier, end_numeral, end_era = match.groups()
+    # "sec. III - V p. Chr." -> the end marker applies to both ends;
+    # "sec. I a. Chr. - I p. Chr." -> each end has its own marker
+    start_bc = (start_era or end_era or "p").lower() == "a"
+    start = century_span(roman_to_int(start_numeral), start_bc, start_qualifier)
+    if end_numeral:
+        end_bc = (end_era or start_era or "p").lower() == "a"
+        end = century_span(roman_to_int(end_numeral), end_bc, end_qualifier)
+    else:
+        end = start
+    return min(start[0], end[0]), max(start[1], end[1])
+
+
+def parse_centuries(text: str) -> tuple:
+    """Find century expressions and return (their (start, end) spans, the unmatched text)."""
+    spans = [century_range_span(match) for match in CENTURY_RANGE_RE.finditer(text)]
+    remaining = []
+    for part in CENTURY_RANGE_RE.sub(" ", text).split(","):
+        match = BARE_CENTURY_RANGE_RE.fullmatch(part.strip())
+        # Bare numerals must look like a plausible century (I..XXI); a lone letter
+        # ("v", "l") only counts as part of a range or with an era marker
+        if match and all(roman_to_int(n) <= 21 for n in (match.group(2), match.group(5)) if n) \
+                and (len(match.group(2)) > 1 or match.group(3) or match.group(5)):
+            spans.append(century_range_span(match))
+        else:
+            remaining.append(part)
+    return spans, ",".join(remaining)
+
+
+def parse_era_years(text: str) -> tuple:
+    """Find years with an era marker and return (their (start, end) spans, the unmatched text)."""
+    spans = []
+    for match in ERA_YEAR_RANGE_RE.finditer(text):
+        start_year, start_era, end_year, end_era = match.groups()
+        start = -int(start_year) if (start_era or end_era).lower() == "a" else int(start_year)
+        end = start
+        if end_year:
+            end = -int(end_year) if end_era.lower() == "a" else int(end_year)
+        spans.append((min(start, end), max(start, end)))
+    return spans, ERA_YEAR_RANGE_RE.sub(" ", text)
+
+
+def parse_dating(dating: str) -> tuple:
+    """Parse a "Datare" value into (start_year, end_year, confidence).
+
+    Returns (None, None, None) if nothing recognizable is found.
+    """
+    if not dating:
+        return None, None, None
+
+    text = strip_diacritics(dating)
+    spans, remaining = parse_centuries(text)
+    has_centuries = bool(spans)
+    era_year_spans, remaining = parse_era_years(remaining)
+    spans += era_year_spans
+    years = [int(year) for year in YEAR_RE.findall(remaining)]
+    remaining = YEAR_RE.sub(" ", remaining)
+
+    if years:
+        spans.append((min(years), max(years)))
+    if spans:
+        # Only explicit years with no unparsed year-like number left over count as exact
+        exact = (not has_centuries and len(spans) == 1 and not UNPARSED_YEAR_RE.search(remaining)
+                 and not APPROXIMATE_RE.search(text))
+        confidence = CONFIDENCE_HIGH if exact else CONFIDENCE_LOW
+        return min(s for s, _ in spans), max(e for _, e in spans), confidence
+
+    for era, start, end in ERAS:
+        if era in text:
+            return start, end, CONFIDENCE_LOW
+
+    return None, None, None
+
+
+if __name__ == "__main__":
+    # Re-parse dating for every row, e.g. after improving this parser
+    from sqlalchemy import create_engine
+    from models import backfill_dating
+    from env import DATABASE_URL_LOCAL
+
+    backfill_dating(create_engine(DATABASE_URL_LOCAL))
+    print("Dating ranges re-parsed")
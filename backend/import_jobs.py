@@ -0,0 +1,196 @@
+"""Background PDF import jobs started through the admin API.
+
+Each job runs in its own worker process (outside the API request path) and
+records per-county progress in the import_jobs / import_job_counties tables,
+so any API process can report it.
+"""
+
+import multiprocessing
+import threading
+import traceback
+from datetime import datetime, timedelta
+from pathlib import Path
+from sqlalchemy import and_, create_engine, func, or_
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.exc import IntegrityError
+
+from models import ImportJob, ImportJobCounty
+from import_pdfs import Throttle, get_county_from_filename, import_pdf
+from env import (
+    IMPORT_MAX_BATCHES_PER_SECOND, IMPORT_JOB_HEARTBEAT_SECONDS, IMPORT_JOB_STALE_SECONDS,
+    IMPORT_JOB_START_TIMEOUT_SECONDS,
+)
+
+PDFS_DIR = Path(__file__).parent / "pdfs"
+
+
+class ImportAlreadyRunning(Exception):
+    """Raised when an import is requested while another one is still active."""
+
+
+def fail_stale_jobs(db: Session) -> None:
+    """Mark active jobs whose heartbeat stopped (worker died, API/container restart) as failed.
+
+    Jobs that never got a heartbeat fall back to their creation time. Jobs still
+    pending (worker never started: failed import, OOM, ...) get the much shorter
+    IMPORT_JOB_START_TIMEOUT_SECONDS.
+    """
+    now = datetime.utcnow()
+    last_seen = func.coalesce(ImportJob.heartbeat_at, ImportJob.created_at)
+    stale = db.query(ImportJob).filter(
+        ImportJob.active.is_(True),
+        or_(
+            last_seen < now - timedelta(seconds=IMPORT_JOB_STALE_SECONDS),
+            and_(ImportJob.status == "pending",
+                 last_seen < now - timedelta(seconds=IMPORT_JOB_START_TIMEOUT_SECONDS)),
+        ),
+    )
+    for job in stale.all():
+        if job.status == "pending":
+            error = f"Worker did not start within {IMPORT_JOB_START_TIMEOUT_SECONDS} seconds"
+        else:
+            error = f"No heartbeat for {IMPORT_JOB_STALE_SECONDS} seconds"
+        finish_import_job(db, job, error=error)
+
+
+def claim_import_job(db: Session, pid: int = None) -> ImportJob:
+    """Create the single active import job.
+
+    Raises ImportAlreadyRunning if another job is pending or running.
+    """
+    fail_stale_jobs(db)
+
+    now = datetime.utcnow()
+    job = ImportJob(status="pending", active=True, pid=pid, created_at=now, heartbeat_at=now)
+    db.add(job)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise ImportAlreadyRunning()
+    return job
+
+
+def finish_import_job(db: Session, job: ImportJob, error: str = None) -> None:
+    """Mark a job done (or failed with error) and release the one-import-at-a-time slot."""
+    job.status = "failed" if error else "done"
+    job.error = error
+    job.active = None
+    job.finished_at = datetime.utcnow()
+    db.commit()
+
+
+class Heartbeat:
+    """Bump a job's heartbeat_at from a background thread while the job runs.
+
+    A thread (rather than progress callbacks) keeps the heartbeat going during
+    long PDF extractions that report no progress.
+    """
+
+    def __init__(self, session_factory, job_id: int, interval: float = IMPORT_JOB_HEARTBEAT_SECONDS):
+        self.session_factory = session_factory
+        self.job_id = job_id
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.thread.join()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                with self.session_factory() as db:
+                    db.query(ImportJob).filter(ImportJob.id == self.job_id).update(
+                        {ImportJob.heartbeat_at: datetime.utcnow()}
+                    )
+                    db.commit()
+            except Exception as e:
+                print(f"Heartbeat for import job {self.job_id} failed: {e}")
+
+
+def start_import_job(db: Session, database_url: str) -> ImportJob:
+    """Create an import job and start its worker process.
+
+    Raises ImportAlreadyRunning if another job is pending or running.
+    """
+    # Reap finished worker processes so they don't linger as zombies
+    multiprocessing.active_children()
+    job = claim_import_job(db)
+
+    # spawn (not fork) so the worker doesn't inherit the API's pooled DB connections
+    ctx = multiprocessing.get_context("spawn")
+    process = ctx.Process(target=run_import_job, args=(job.id, database_url), daemon=True)
+    try:
+        process.start()
+    except Exception:
+        finish_import_job(db, job, error=traceback.format_exc(limit=5))
+        raise
+
+    job.pid = process.pid
+    db.commit()
+    return job
+
+
+def run_import_job(job_id: int, database_url: str) -> None:
+    """Worker process entry point: import every PDF and record progress."""
+    engine = create_engine(database_url)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    # Progress is written through its own session so batch rollbacks don't discard it
+    progress_db = SessionLocal()
+    db = SessionLocal()
+    job = progress_db.get(ImportJob, job_id)
+    # First thing: show the worker is alive, so the job isn't reaped as never started
+    job.status = "running"
+    job.heartbeat_at = datetime.utcnow()
+    progress_db.commit()
+    error = None
+
+    try:
+        with Heartbeat(SessionLocal, job_id):
+            import_all_pdfs(job, progress_db, db)
+    except Exception:
+        progress_db.rollback()
+        error = traceback.format_exc(limit=5)
+    finally:
+        finish_import_job(progress_db, job, error)
+        db.close()
+        progress_db.close()
+        engine.dispose()
+
+
+def import_all_pdfs(job: ImportJob, progress_db: Session, db: Session) -> None:
+    """Import every PDF in PDFS_DIR, recording per-county progress on job."""
+    pdf_files = sorted(PDFS_DIR.glob("*.pdf"))
+    if not pdf_files:
+        raise RuntimeError(f"No PDF files found in {PDFS_DIR}")
+
+    counties = {}
+    for pdf_path in pdf_files:
+        county = get_county_from_filename(pdf_path.name)
+        counties[county] = ImportJobCounty(job_id=job.id, county=county)
+        progress_db.add(counties[county])
+    progress_db.commit()
+
+    throttle = Throttle(IMPORT_MAX_BATCHES_PER_SECOND)
+    for pdf_path in pdf_files:
+        county = get_county_from_filename(pdf_path.name)
+        progress = counties[county]
+        progress.status = "running"
+        progress_db.commit()
+
+        def on_progress(imported, errors, total):
+            progress.imported = imported
+            progress.errors = errors
+            progress.rows_total = total
+            progress_db.commit()
+
+        import_pdf(pdf_path, db, county, throttle=throttle, on_progress=on_progress)
+        progress.status = "done"
+        progress_db.commit()
@@ -1,16 +1,20 @@
 #!/usr/bin/env python3
 """Import all PDFs into the database."""
 
+import argparse
 import sys
+import time
 from pathlib import Path
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.exc import IntegrityError
 
-from models import Monument, Base
+from models import Monument, init_db
+from dating import parse_dating
+from dataset import COLUMNS, write_dataset
 from read_pdf import extract_table
+from word_cache import prune_word_cache
 from pdf_config import COLUMN_COORDS, TABLE_BBOX_PERCENT, OTHER_PAGES_TOP
-from env import DATABASE_URL_LOCAL
+from env import DATABASE_URL_LOCAL, IMPORT_BATCH_SIZE, IMPORT_MAX_BATCHES_PER_SECOND
 
 
 def get_county_from_filename(filename: str) -> str:
@@ -26,6 +30,8 @@ def map_row_to_monument(row: list, county: str) -> Monument:
     try:
         # Parse row number (first column)
         id_value = int(row[0]) if row[0] and row[0].strip() else None
+        dating = row[5] if len(row) > 5 and row[5] else None
+        dating_start, dating_end, dating_confidence = parse_dating(dating)
         
         return Monument(
             id=id_value,
@@ -33,31 +39,107 @@ def map_row_to_monument(row: list, county: str) -> Monument:
             name=row[2] if len(row) > 2 and row[2] else "",
             city=row[3] if len(row) > 3 and row[3] else "",
             address=row[4] if len(row) > 4 and row[4] else None,
-            dating=row[5] if len(row) > 5 and row[5] else None,
+            dating=dating,
+            dating_start=dating_start,
+            dating_end=dating_end,
+            dating_confidence=dating_confidence,
             county=county,
         )
     except (ValueError, IndexError):
         return None
 
 
-def import_pdf(pdf_path: Path, db_session, county: str):
-    """Import a single PDF into the database."""
-    print(f"Processing: {pdf_path.name}")
-    
-    rows = extract_table(
+def extract_rows(pdf_path: Path) -> list:
+    """Extract all table rows of a PDF using the configured column layout."""
+    return extract_table(
         str(pdf_path),
         column_coords=COLUMN_COORDS,
         table_bbox_percent=TABLE_BBOX_PERCENT,
         page_num=None,  # Process all pages
         other_pages_top=OTHER_PAGES_TOP,
     )
+
+
+class Throttle:
+    """Limit how often write batches are committed so imports don't starve API reads."""
+
+    def __init__(self, max_per_second: float):
+        self.min_interval = 1.0 / max_per_second if max_per_second > 0 else 0.0
+        self.last = 0.0
+
+    def wait(self):
+        """Sleep until the next batch is allowed to be written."""
+        if not self.min_interval:
+            return
+        delay = self.last + self.min_interval - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.last = time.monotonic()
+
+
+def write_batch(db_session, monuments: list, throttle: Throttle = None) -> tuple:
+    """Upsert a batch of monuments in one transaction.
+    
+    If the batch fails as a whole, its halves are retried the same way, so a
+    single bad row only counts as one error and costs a few extra transactions.
+    throttle (if given) is waited on before every commit, retries included.
+    """
+    if throttle:
+        throttle.wait()
+    try:
+        for monument in monuments:
+            db_session.merge(monument)
+        db_session.commit()
+        return len(monuments), 0
+    except Exception:
+        db_session.rollback()
+    
+    if len(monuments) == 1:
+        return 0, 1
+    middle = len(monuments) // 2
+    first_imported, first_errors = write_batch(db_session, monuments[:middle], throttle)
+    second_imported, second_errors = write_batch(db_session, monuments[middle:], throttle)
+    return first_imported + second_imported, first_errors + second_errors
+
+
+def import_pdf(pdf_path: Path, db_session, county: str, batch_size: int = IMPORT_BATCH_SIZE,
+               throttle: Throttle = None, on_progress=None):
+    """Import a single PDF into the database.
+    
+    See write_rows for batch_size, throttle and on_progress.
+    """
+    print(f"Processing: {pdf_path.name}")
+    
+    rows = extract_rows(pdf_path)
     
     if not rows:
         print(f"  No rows extracted")
         return 0, 0
     
+    imported, errors = write_rows(rows, db_session, county, batch_size, throttle, on_progress)
+    print(f"  Imported: {imported}, Errors: {errors}")
+    return imported, errors
+
+
+def write_rows(rows: list, db_session, county: str, batch_size: int = IMPORT_BATCH_SIZE,
+               throttle: Throttle = None, on_progress=None):
+    """Upsert extracted rows of one county into the database.
+    
+    Rows are written in batches of batch_size; throttle (if given) limits the
+    rate of commits, including retries of failed batches. on_progress(imported, errors, total) is called after each batch.
+    """
     imported = 0
     errors = 0
+    batch = []
+    
+    def flush():
+        nonlocal imported, errors
+        batch_imported, batch_errors = write_batch(db_session, batch, throttle)
+        imported += batch_imported
+        errors += batch_errors
+        batch.clear()
+        if on_progress:
+            on_progress(imported, errors, len(rows))
     
     for row in rows:
         monument = map_row_to_monument(row, county)
@@ -65,38 +147,46 @@ def import_pdf(pdf_path: Path, db_session, county: str):
             errors += 1
             continue
         
-        try:
-            db_session.add(monument)
-            db_session.commit()
-            imported += 1
-        except IntegrityError:
-            db_session.rollback()
-            # Try to update existing record
-            try:
-                existing = db_session.query(Monument).filter_by(lmi_code=monument.lmi_code).first()
-                if existing:
-                    existing.id = monument.id
-                    existing.name = monument.name
-                    existing.city = monument.city
-                    existing.address = monument.address
-                    existing.dating = monument.dating
-                    existing.county = monument.county
-                    db_session.commit()
-                    imported += 1
-                else:
-                    errors += 1
-            except Exception as e:
-                db_session.rollback()
-                errors += 1
-        except Exception as e:
-            db_session.rollback()
-            errors += 1
+        batch.append(monument)
+        if len(batch) >= batch_size:
+            flush()
+    
+    if batch:
+        flush()
+    elif on_progress:
+        on_progress(imported, errors, len(rows))
     
-    print(f"  Imported: {imported}, Errors: {errors}")
     return imported, errors
 
 
+def export_dataset(pdf_files: list, output_path: Path):
+    """Extract all PDFs and write the monuments to a dataset file instead of the database."""
+    monuments = {}  # keyed by lmi_code, later rows win like the database upsert
+    errors = 0
+    
+    for pdf_path in pdf_files:
+        print(f"Processing: {pdf_path.name}")
+        county = get_county_from_filename(pdf_path.name)
+        for row in extract_rows(pdf_path) or []:
+            monument = map_row_to_monument(row, county)
+            if not monument or monument.id is None:
+                errors += 1
+                continue
+            monuments[monument.lmi_code] = {
+                column: getattr(monument, column) for column in COLUMNS
+            }
+    
+    checksum = write_dataset(output_path, list(monuments.values()))
+    print(f"\nExported {len(monuments)} monuments to {output_path} ({errors} errors)")
+    print(f"sha256: {checksum}")
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Import all PDFs into the database.")
+    parser.add_argument("--export", metavar="FILE", type=Path,
+                        help="Write a dataset file (see dataset.py) instead of importing")
+    args = parser.parse_args()
+    
     script_dir = Path(__file__).parent
     pdfs_dir = script_dir / "pdfs"
     
@@ -104,14 +194,6 @@ def main():
         print(f"Error: PDFs directory not found: {pdfs_dir}")
         sys.exit(1)
     
-    # Database setup
-    database_url = DATABASE_URL_LOCAL
-    engine = create_engine(database_url)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    
-    # Create tables if they don't exist
-    Base.metadata.create_all(bind=engine)
-    
     # Get all PDF files
     pdf_files = sorted(pdfs_dir.glob("*.pdf"))
     
@@ -120,15 +202,29 @@ def main():
         sys.exit(1)
     
     print(f"Found {len(pdf_files)} PDF files\n")
+    prune_word_cache(pdfs_dir)
+    
+    if args.export:
+        export_dataset(pdf_files, args.export)
+        return
+    
+    # Database setup
+    database_url = DATABASE_URL_LOCAL
+    engine = create_engine(database_url)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    # Create tables if they don't exist
+    init_db(engine)
     
     db_session = SessionLocal()
+    throttle = Throttle(IMPORT_MAX_BATCHES_PER_SECOND)
     total_imported = 0
     total_errors = 0
     
     try:
         for pdf_path in pdf_files:
             county = get_county_from_filename(pdf_path.name)
-            imported, errors = import_pdf(pdf_path, db_session, county)
+            imported, errors = import_pdf(pdf_path, db_session, county, throttle=throttle)
             total_imported += imported
             total_errors += errors
     finally:
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""Load-test the /monuments endpoint against a local database and report latency percentiles.
+
+Seeds a SQLite or PostgreSQL database (synthetic rows or the real PDFs), starts
+the API with uvicorn (unless --url is given) and drives /monuments with a mix of
+counties, page depths and concurrency levels. Results are printed as JSON.
+
+Without --database-url, a scratch SQLite file next to this script is seeded with
+synthetic rows. With --database-url nothing is seeded unless --seed is given, and
+synthetic seeding (which deletes all monuments) refuses a non-empty table
+unless --force is passed.
+
+Example:
+    python load_test.py --concurrency 1,10,50 --requests 500 --output results.json
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import requests
+from sqlalchemy import create_engine, func, insert, make_url, select
+from sqlalchemy.orm import sessionmaker
+
+from models import Monument, init_db
+from dating import parse_dating
+from download_pdfs import COUNTY_NAMES
+
+NAME_TEMPLATES = [
+    "Biserica de lemn „Sf. {saint}”",
+    "Biserica „Sf. {saint}”",
+    "Casă",
+    "Casa {family}",
+    "Situl arheologic de la {city}",
+    "Ansamblul bisericii „Sf. {saint}”",
+    "Conacul {family}",
+    "Școala veche",
+]
+SAINTS = ["Nicolae", "Gheorghe", "Mihail și Gavril", "Dumitru", "Paraschiva", "Ilie"]
+FAMILIES = ["Bánffy", "Cantacuzino", "Brâncoveanu", "Ghica", "Sturdza", "Teleki"]
+DATINGS = [
+    "sec. XVIII", "sec. XIX", "mijl. sec. XIX", "1890-1900", "1780", "sf. sec. XVII",
+    "Epoca romană", "Neolitic, Cultura Cucuteni", "înc. sec. XX",
+]
+DEFAULT_DATABASE_URL = f"sqlite:///{Path(__file__).parent / 'load_test.sqlite'}"
+
+CATEGORIES = ["I", "II", "III", "IV"]
+TYPES = {"I": "s", "II": "m", "III": "m", "IV": "m"}
+
+
+def synthetic_monument(county_code: str, county: str, number: int, rng: random.Random) -> dict:
+    """Build one realistic-looking monument row."""
+    category = rng.choice(CATEGORIES)
+    city = f"sat {rng.choice(FAMILIES)}eni; comuna {county}"
+    name = rng.choice(NAME_TEMPLATES).format(
+        saint=rng.choice(SAINTS), family=rng.choice(FAMILIES), city=city
+    )
+    dating = rng.choice(DATINGS)
+    dating_start, dating_end, dating_confidence = parse_dating(dating)
+    return {
+        "lmi_code": f"{county_code}-{category}-{TYPES[category]}-{rng.choice('AB')}-{number:05d}",
+        "id": number,
+        "county": county,
+        "name": name,
+        "city": city,
+        "address": f"Str. Principală {rng.randint(1, 400)}",
+        "dating": dating,
+        "dating_start": dating_start,
+        "dating_end": dating_end,
+        "dating_confidence": dating_confidence,
+    }
+
+
+def resolve_database_url(database_url: str) -> str:
+    """Make a relative SQLite path absolute, so the seeding step and the started
+    server (which runs from backend/) use the same file."""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database and url.database != ":memory:":
+        url = url.set(database=str(Path(url.database).resolve()))
+    return url.render_as_string(hide_password=False)
+
+
+def seed_synthetic(database_url: str, rows_per_county: int, rng: random.Random,
+                   force: bool = False) -> int:
+    """Replace the monuments table contents with synthetic rows for every county.
+
+    Refuses to delete existing rows of any database but the default scratch one
+    unless force is set.
+    """
+    engine = create_engine(database_url)
+    init_db(engine)
+    total = 0
+    with engine.begin() as conn:
+        existing = conn.execute(select(func.count()).select_from(Monument.__table__)).scalar()
+        if existing and not force and database_url != resolve_database_url(DEFAULT_DATABASE_URL):
+            raise SystemExit(
+                f"Error: {make_url(database_url).render_as_string()} already has {existing} monuments; "
+                f"seeding would delete them. Pass --force to seed anyway."
+            )
+        conn.execute(Monument.__table__.delete())
+        for county_code, county in COUNTY_NAMES.items():
+            rows = [synthetic_monument(county_code, county, n, rng) for n in range(1, rows_per_county + 1)]
+            conn.execute(insert(Monument), rows)
+            total += len(rows)
+    engine.dispose()
+    return total
+
+
+def seed_from_pdfs(database_url: str) -> int:
+    """Import the real PDFs from pdfs/ into the database."""
+    from import_pdfs import get_county_from_filename, import_pdf
+
+    engine = create_engine(database_url)
+    init_db(engine)
+    db_session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    total = 0
+    try:
+        for pdf_path in sorted((Path(__file__).parent / "pdfs").glob("*.pdf")):
+            imported, _ = import_pdf(pdf_path, db_session, get_county_from_filename(pdf_path.name))
+            total += imported
+    finally:
+        db_session.close()
+        engine.dispose()
+    return total
+
+
+def start_server(database_url: str, port: int) -> subprocess.Popen:
+    """Start the API with uvicorn against database_url and wait until it is healthy."""
+    env = {**os.environ, "DATABASE_URL": database_url}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=Path(__file__).parent, env=env,
+    )
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            if requests.get(f"{url}/health", timeout=1).json().get("status") == "healthy":
+                return server
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("API server did not become healthy")
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return round(sorted_values[index], 2)
+
+
+def run_level(url: str, concurrency: int, num_requests: int, counties: list, max_page: int,
+              page_size: int, rng: random.Random) -> dict:
+    """Fire num_requests random /monuments requests with the given concurrency."""
+    targets = [(rng.choice(counties), rng.randint(1, max_page)) for _ in range(num_requests)]
+    session = requests.Session()
+    session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=concurrency))
+
+    def fetch(target):
+        county, page = target
+        start = time.perf_counter()
+        try:
+            response = session.get(
+                f"{url}/monuments",
+                params={"county": county, "page": page, "page_size": page_size},
+                timeout=30,
+            )
+            ok = response.status_code == 200
+            empty = ok and response.json()["count"] == 0
+        except (requests.RequestException, ValueError):
+            ok = False
+            empty = False
+        return time.perf_counter() - start, ok, empty
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(fetch, targets))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency * 1000 for latency, ok, _ in results if ok)
+    errors = sum(1 for _, ok, _ in results if not ok)
+    # count == 0 means the county has no rows at all, usually an unseeded database
+    empty = sum(1 for _, _, empty in results if empty)
+    return {
+        "concurrency": concurrency,
+        "requests": num_requests,
+        "errors": errors,
+        "error_rate": errors / num_requests,
+        "empty_responses": empty,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(num_requests / elapsed, 1),
+        "latency_ms": {
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": round(latencies[-1], 2) if latencies else None,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url",
+                        help="Database to seed and serve from (default: a scratch SQLite file; "
+                             "relative SQLite paths are resolved against the current directory)")
+    parser.add_argument("--seed", choices=["synthetic", "pdfs", "none"],
+                        help="How to populate the database before the run (default: synthetic "
+                             "for the scratch database, none with --database-url)")
+    parser.add_argument("--force", action="store_true",
+                        help="Allow synthetic seeding to delete monuments of a non-empty database")
+    parser.add_argument("--rows-per-county", type=int, default=1000,
+                        help="Synthetic rows per county")
+    parser.add_argument("--url", help="Use an already running API instead of starting one")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the started API")
+    parser.add_argument("--concurrency", default="1,10,50",
+                        help="Comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per concurrency level")
+    parser.add_argument("--counties", help="Comma-separated counties (default: all)")
+    parser.add_argument("--max-page", type=int, default=10, help="Deepest page requested")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--random-seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+    if args.seed is None:
+        args.seed = "none" if args.database_url else "synthetic"
+    args.database_url = resolve_database_url(args.database_url or DEFAULT_DATABASE_URL)
+
+    rng = random.Random(args.random_seed)
+    counties = args.counties.split(",") if args.counties else list(COUNTY_NAMES.values())
+
+    seeded = None
+    if args.seed == "synthetic":
+        seeded = seed_synthetic(args.database_url, args.rows_per_county, rng, args.force)
+    elif args.seed == "pdfs":
+        seeded = seed_from_pdfs(args.database_url)
+
+    server = None
+    url = args.url
+    if not url:
+        server = start_server(args.database_url, args.port)
+        url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        levels = [
+            run_level(url, int(concurrency), args.requests, counties, args.max_page,
+                      args.page_size, rng)
+            for concurrency in args.concurrency.split(",")
+        ]
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    warnings = [
+        f"concurrency {level['concurrency']}: {level['empty_responses']} of {level['requests']} "
+        f"responses had count == 0 (empty or unseeded database?)"
+        for level in levels if level["empty_responses"]
+    ]
+    for warning in warnings:
+        print(f"Warning: {warning}", file=sys.stderr)
+
+    report = {
+        "url": url,
+        "database_url": args.database_url if not args.url else None,
+        "seeded_rows": seeded,
+        "counties": len(counties),
+        "max_page": args.max_page,
+        "page_size": args.page_size,
+        "levels": levels,
+        "warnings": warnings,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,26 @@
-from fastapi import FastAPI, Query, Depends
+import asyncio
+import json
+from fastapi import FastAPI, Query, Depends, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, text
+from fastapi.middleware.gzip import GZipMiddleware
+from sqlalchemy import create_engine, func, select, text
 from sqlalchemy.orm import sessionmaker, Session
 
-from models import Base, Monument, MonumentResponse, PaginatedMonumentsResponse
-from env import DATABASE_URL
+from models import (
+    Monument, MonumentResponse, PaginatedMonumentsResponse, PaginatedMonumentsProjectionResponse,
+    ImportJob, ImportJobResponse, init_db,
+)
+from import_jobs import ImportAlreadyRunning, start_import_job
+from singleflight import SingleFlight, TooManyWaiters
+from env import (
+    DATABASE_URL, ADMIN_TOKEN, SINGLEFLIGHT_MAX_WAITERS, SINGLEFLIGHT_TIMEOUT,
+    COMPRESSION_MIN_SIZE,
+)
+
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
 
 app = FastAPI(title="Patrimoniu API")
 
@@ -17,13 +33,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Response compression: brotli (with gzip fallback) if brotli-asgi is installed, else gzip
+if BrotliMiddleware:
+    app.add_middleware(BrotliMiddleware, minimum_size=COMPRESSION_MIN_SIZE, gzip_fallback=True)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESSION_MIN_SIZE)
+
 # Database setup
 database_url = DATABASE_URL
 engine = create_engine(database_url)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create tables
-Base.metadata.create_all(bind=engine)
+init_db(engine)
+
+# Identical concurrent /monuments queries share one DB execution
+monuments_flight = SingleFlight(max_waiters=SINGLEFLIGHT_MAX_WAITERS, timeout=SINGLEFLIGHT_TIMEOUT)
 
 
 def get_db():
@@ -47,28 +72,124 @@ async def health():
         return {"status": "unhealthy", "error": str(e)}
 
 
-@app.get("/monuments", response_model=PaginatedMonumentsResponse)
+@app.get("/metrics")
+async def metrics():
+    return {"monuments_singleflight": monuments_flight.metrics()}
+
+
+# Columns selectable for list responses, in MonumentResponse field order. The
+# pydantic models stay the OpenAPI contract; rows are serialized directly.
+RESPONSE_COLUMNS = {name: Monument.__table__.c[name] for name in MonumentResponse.model_fields}
+
+
+def parse_fields(fields: str | None) -> tuple:
+    """Validate a comma-separated fields= projection; returns field names in model order."""
+    if not fields:
+        return tuple(RESPONSE_COLUMNS)
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    if not requested:
+        raise HTTPException(status_code=422, detail="fields must name at least one field")
+    unknown = requested - RESPONSE_COLUMNS.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}. Allowed: {', '.join(RESPONSE_COLUMNS)}",
+        )
+    return tuple(name for name in RESPONSE_COLUMNS if name in requested)
+
+
+def query_monuments(county: str | None, from_year: int | None, to_year: int | None,
+                    page: int, page_size: int, fields: tuple = tuple(RESPONSE_COLUMNS)) -> bytes:
+    """Run the paginated monuments query and return the serialized JSON response.
+    
+    Only the columns in fields are selected and serialized. Uses Core row tuples
+    instead of ORM instances and pydantic models, which avoids building three
+    objects per row.
+    """
+    skip = (page - 1) * page_size
+    
+    conditions = []
+    if county is not None:
+        conditions.append(Monument.county == county)
+    # Dating range must overlap [from_year, to_year]; uses the dating_start/dating_end indexes
+    if from_year is not None:
+        conditions.append(Monument.dating_end >= from_year)
+    if to_year is not None:
+        conditions.append(Monument.dating_start <= to_year)
+    
+    count_query = select(func.count()).select_from(Monument.__table__).where(*conditions)
+    # Order by county, then id (Nr. crt.)
+    page_query = (
+        select(*(RESPONSE_COLUMNS[name] for name in fields)).where(*conditions)
+        .order_by(Monument.county, Monument.id)
+        .offset(skip).limit(page_size)
+    )
+    
+    with engine.connect() as connection:
+        total = connection.execute(count_query).scalar_one()
+        rows = connection.execute(page_query).all()
+    
+    return json.dumps({
+        "count": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": (total + page_size - 1) // page_size,
+        "results": [dict(zip(fields, row)) for row in rows],
+    }, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+@app.get("/monuments", response_model=PaginatedMonumentsResponse | PaginatedMonumentsProjectionResponse)
 async def get_monuments(
-    county: str = Query(..., description="County name"),
+    county: str | None = Query(None, description="County name (all counties if omitted)"),
+    from_year: int | None = Query(None, description="Only monuments dated in or after this year (negative = BC)"),
+    to_year: int | None = Query(None, description="Only monuments dated in or before this year (negative = BC)"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db)
+    fields: str | None = Query(None, description=(
+        "Comma-separated monument fields to return (default: all). "
+        "Fields not listed are omitted from each result"
+    )),
 ):
-    """Get monuments by county with pagination."""
-    skip = (page - 1) * page_size
-    
-    # Query monuments filtered by county, ordered by id (Nr. crt.)
-    query = db.query(Monument).filter(Monument.county == county).order_by(Monument.id)
-    total = query.count()
-    monuments = query.offset(skip).limit(page_size).all()
+    """Get monuments by county and/or dating period with pagination."""
+    key = (county, from_year, to_year, page, page_size, parse_fields(fields))
+    try:
+        body = await monuments_flight.do(key, query_monuments, *key)
+    except TooManyWaiters:
+        raise HTTPException(status_code=503, detail="Too many identical requests in flight",
+                            headers={"Retry-After": "1"})
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Query timed out")
     
-    return PaginatedMonumentsResponse(
-        count=total,
-        page=page,
-        page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size,
-        results=[MonumentResponse.model_validate(m) for m in monuments]
-    )
+    return Response(content=body, media_type="application/json")
+
+
+def require_admin(x_admin_token: str = Header(None)):
+    """Dependency that guards admin endpoints with the ADMIN_TOKEN header."""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin API disabled (ADMIN_TOKEN not set)")
+    if x_admin_token != ADMIN_TOKEN:
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+@app.post("/admin/imports", response_model=ImportJobResponse, status_code=202,
+          dependencies=[Depends(require_admin)])
+def start_import(db: Session = Depends(get_db)):
+    """Start a background import of all PDFs. Only one import may run at a time."""
+    try:
+        job = start_import_job(db, database_url)
+    except ImportAlreadyRunning:
+        raise HTTPException(status_code=409, detail="An import is already running")
+    return ImportJobResponse.model_validate(job)
+
+
+@app.get("/admin/imports/{job_id}", response_model=ImportJobResponse,
+         dependencies=[Depends(require_admin)])
+def get_import(job_id: int, db: Session = Depends(get_db)):
+    """Get the status and per-county progress of an import job."""
+    job = db.get(ImportJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return ImportJobResponse.model_validate(job)
 
 
 if __name__ == "__main__":
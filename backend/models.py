@@ -1,7 +1,9 @@
 """Database models and API response models for the Patrimoniu application."""
 
-from sqlalchemy import Column, Integer, String
+from datetime import datetime
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from pydantic import BaseModel
 from typing import List
 
@@ -19,6 +21,93 @@ class Monument(Base):
     city = Column(String, nullable=False, index=True)
     address = Column(String)
     dating = Column(String)
+    # Year range parsed from dating (negative = BC) and "high"/"low" parse confidence
+    dating_start = Column(Integer)
+    dating_end = Column(Integer, index=True)
+    dating_confidence = Column(String)
+    
+    __table_args__ = (
+        Index("ix_monuments_dating", "dating_start", "dating_end"),
+        Index("ix_monuments_county_dating", "county", "dating_start", "dating_end"),
+    )
+
+
+def init_db(engine) -> None:
+    """Create tables and add columns/indexes introduced after a table was first created.
+    
+    There is no migrations framework, so new columns must be nullable.
+    """
+    Base.metadata.create_all(bind=engine)
+    
+    inspector = inspect(engine)
+    added = []
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            missing = [column for column in table.columns if column.name not in existing]
+            for column in missing:
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                added.append(column.name)
+            if missing:
+                for index in table.indexes:
+                    index.create(bind=conn, checkfirst=True)
+    
+    if "dating_start" in added:
+        backfill_dating(engine)
+
+
+def backfill_dating(engine) -> None:
+    """Parse dating into dating_start/dating_end/dating_confidence for existing rows."""
+    from dating import parse_dating
+    
+    with engine.begin() as conn:
+        rows = conn.execute(
+            text("SELECT lmi_code, dating FROM monuments WHERE dating IS NOT NULL")
+        ).all()
+        updates = []
+        for lmi_code, dating in rows:
+            start, end, confidence = parse_dating(dating)
+            if start is not None:
+                updates.append({"lmi_code": lmi_code, "start": start, "end": end, "confidence": confidence})
+        if updates:
+            conn.execute(
+                text("UPDATE monuments SET dating_start = :start, dating_end = :end, "
+                     "dating_confidence = :confidence WHERE lmi_code = :lmi_code"),
+                updates,
+            )
+
+
+class ImportJob(Base):
+    """Background PDF import job started through the admin API."""
+    __tablename__ = "import_jobs"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    status = Column(String, nullable=False, default="pending")  # pending, running, done, failed
+    # True while the job is pending/running, NULL afterwards. The unique index allows
+    # any number of NULLs but only one True, so the database enforces one import at a time.
+    active = Column(Boolean, unique=True, nullable=True, default=True)
+    pid = Column(Integer)
+    error = Column(String)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    # Bumped periodically by the worker; jobs whose heartbeat stops are marked failed
+    heartbeat_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    
+    counties = relationship("ImportJobCounty", order_by="ImportJobCounty.county",
+                            cascade="all, delete-orphan")
+
+
+class ImportJobCounty(Base):
+    """Per-county progress of an import job."""
+    __tablename__ = "import_job_counties"
+    
+    job_id = Column(Integer, ForeignKey("import_jobs.id"), primary_key=True)
+    county = Column(String, primary_key=True)
+    status = Column(String, nullable=False, default="pending")  # pending, running, done
+    rows_total = Column(Integer, nullable=False, default=0)
+    imported = Column(Integer, nullable=False, default=0)
+    errors = Column(Integer, nullable=False, default=0)
 
 
 # Pydantic models for API responses
@@ -30,6 +119,8 @@ class MonumentResponse(BaseModel):
     city: str
     address: str | None
     dating: str | None
+    dating_start: int | None = None
+    dating_end: int | None = None
     county: str
 
     class Config:
@@ -44,3 +135,49 @@ class PaginatedMonumentsResponse(BaseModel):
     total_pages: int
     results: List[MonumentResponse]
 
+
+class MonumentProjectionResponse(BaseModel):
+    """A monument restricted to the fields= projection; fields not requested are absent."""
+    id: int | None = None
+    lmi_code: str | None = None
+    name: str | None = None
+    city: str | None = None
+    address: str | None = None
+    dating: str | None = None
+    dating_start: int | None = None
+    dating_end: int | None = None
+    county: str | None = None
+
+
+class PaginatedMonumentsProjectionResponse(BaseModel):
+    """Response model for paginated monuments list when fields= is given."""
+    count: int
+    page: int
+    page_size: int
+    total_pages: int
+    results: List[MonumentProjectionResponse]
+
+
+class ImportJobCountyResponse(BaseModel):
+    """Response model for per-county import progress."""
+    county: str
+    status: str
+    rows_total: int
+    imported: int
+    errors: int
+
+    class Config:
+        from_attributes = True
+
+
+class ImportJobResponse(BaseModel):
+    """Response model for an import job and its progress."""
+    id: int
+    status: str
+    error: str | None
+    created_at: datetime
+    finished_at: datetime | None
+    counties: List[ImportJobCountyResponse]
+
+    class Config:
+        from_attributes = True
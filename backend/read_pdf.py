@@ -3,8 +3,8 @@
 
 import sys
 from pathlib import Path
-import pdfplumber
 from pdf_config import COLUMN_COORDS, TABLE_BBOX_PERCENT, OTHER_PAGES_TOP
+from word_cache import PageWords, WORD_CACHE_DIR
 
 
 def is_child_row(row: list) -> bool:
@@ -47,35 +47,36 @@ def calculate_crop(page_width: float, page_height: float, table_bbox_percent: di
 
 
 def extract_table(pdf_path: str, column_coords: dict, table_bbox_percent: dict,
-                  page_num: int = None, other_pages_top: float = 0.1):
-    """Extract table rows and split into columns based on column boundaries."""
+                  page_num: int = None, other_pages_top: float = 0.1,
+                  cache_dir: Path = WORD_CACHE_DIR):
+    """Extract table rows and split into columns based on column boundaries.
+    
+    Page words are read through the word cache in cache_dir (None disables it),
+    so changing column_coords doesn't re-parse the PDF.
+    """
     pdf_file = Path(pdf_path)
     if not pdf_file.exists():
         print(f"Error: PDF file not found at {pdf_path}")
         return None
     
-    with pdfplumber.open(pdf_file) as pdf:
+    with PageWords(pdf_file, cache_dir) as pdf:
         # Determine which pages to process
         if page_num is None:
-            pages_to_process = range(len(pdf.pages))
+            pages_to_process = range(pdf.num_pages)
         else:
-            if page_num >= len(pdf.pages):
+            if page_num >= pdf.num_pages:
                 return None
             pages_to_process = [page_num]
         
         all_rows = []
         last_row_from_previous_page = None
         
-        first_page = pdf.pages[pages_to_process[0]]
-        crop = calculate_crop(first_page.width, first_page.height, table_bbox_percent, other_pages_top)
+        first_width, first_height = pdf.page_sizes[pages_to_process[0]]
+        crop = calculate_crop(first_width, first_height, table_bbox_percent, other_pages_top)
         
         for current_page_num in pages_to_process:
-            page = pdf.pages[current_page_num]
-            page_width = page.width
-            page_height = page.height
-        
             crop_top = crop['first'] if current_page_num == 0 else crop['top']
-            page = page.crop((crop['left'], crop_top, crop['right'], crop['bottom']))
+            words = pdf.words(current_page_num, (crop['left'], crop_top, crop['right'], crop['bottom']))
             
             sorted_columns = sorted(column_coords.items(), key=lambda x: x[1])
             column_boundaries = []
@@ -87,8 +88,6 @@ def extract_table(pdf_path: str, column_coords: dict, table_bbox_percent: dict,
             column_boundaries.append(cropped_width)
             column_boundaries = sorted(list(set(column_boundaries)))
             
-            words = page.extract_words()
-            
             # Group words by y-position to form lines
             rows_dict = {}
             for word in words:
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Refresh the database by pipelining download -> extract -> write.
+
+Each county PDF moves to extraction as soon as it is downloaded, and its rows
+go to the database writer while other counties are still downloading or being
+parsed. Stages are connected by bounded queues, so a slow stage applies
+back-pressure instead of letting work pile up in memory. Extraction runs in a
+process pool since pdfplumber is CPU-bound.
+
+At the end a per-stage report shows throughput, time spent busy, time idle
+waiting for input and time blocked on a full output queue (back-pressure).
+
+The run holds an import job slot (see import_jobs.py), so it never overlaps
+an admin import.
+"""
+
+import argparse
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models import init_db
+from import_jobs import ImportAlreadyRunning, Heartbeat, claim_import_job, finish_import_job
+from download_pdfs import URLS, COUNTY_NAMES, extract_county_code, download_pdf
+from import_pdfs import Throttle, extract_rows, get_county_from_filename, write_rows
+from word_cache import prune_word_cache
+from env import DATABASE_URL_LOCAL, IMPORT_MAX_BATCHES_PER_SECOND
+
+PDFS_DIR = Path(__file__).parent / "pdfs"
+
+DONE = object()  # end-of-stream marker passed between stages
+
+
+class Stage:
+    """A pipeline stage: worker threads applying func to items from inbox.
+
+    func returns the item for the next stage, or None to drop it (e.g. a
+    failed download). When every worker has seen DONE, one DONE per worker of
+    the next stage is forwarded.
+    """
+
+    def __init__(self, name: str, func, workers: int, inbox: queue.Queue, outbox: queue.Queue = None):
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.inbox = inbox
+        self.outbox = outbox
+        self.next_stage = None
+        self.lock = threading.Lock()
+        self.running = workers
+        self.threads = []
+        self.items = 0
+        self.failed = 0
+        self.busy = 0.0
+        self.waiting_input = 0.0
+        self.blocked_output = 0.0
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self.work, name=f"{self.name}-{i}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def join(self):
+        for thread in self.threads:
+            thread.join()
+
+    def work(self):
+        while True:
+            waited = time.perf_counter()
+            item = self.inbox.get()
+            started = time.perf_counter()
+            if item is DONE:
+                break
+
+            try:
+                result = self.func(item)
+            except Exception as e:
+                print(f"[{self.name}] {item!r}: {e}")
+                result = None
+            finished = time.perf_counter()
+
+            if result is not None and self.outbox is not None:
+                self.outbox.put(result)
+            with self.lock:
+                self.waiting_input += started - waited
+                self.busy += finished - started
+                self.blocked_output += time.perf_counter() - finished
+                self.items += 1
+                if result is None:
+                    self.failed += 1
+
+        with self.lock:
+            self.waiting_input += started - waited
+            self.running -= 1
+            last = self.running == 0
+        if last and self.outbox is not None:
+            for _ in range(self.next_stage.workers if self.next_stage else 1):
+                self.outbox.put(DONE)
+
+    def report(self, elapsed: float) -> str:
+        return (
+            f"{self.name:<10} {self.workers:>7} {self.items:>6} {self.failed:>6} "
+            f"{self.items / elapsed:>8.2f} {self.busy:>9.1f} {self.waiting_input:>10.1f} "
+            f"{self.blocked_output:>12.1f}"
+        )
+
+
+def pipeline(*stages: Stage):
+    """Link stages so each forwards end-of-stream markers to the next."""
+    for stage, next_stage in zip(stages, stages[1:]):
+        stage.next_stage = next_stage
+    return stages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download, extract and import all county PDFs as a pipeline.")
+    parser.add_argument("--database-url", default=DATABASE_URL_LOCAL)
+    parser.add_argument("--skip-download", action="store_true",
+                        help="Use the PDFs already in pdfs/ instead of downloading")
+    parser.add_argument("--download-workers", type=int, default=4)
+    parser.add_argument("--extract-workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--queue-size", type=int, default=4,
+                        help="Max items waiting between two stages")
+    args = parser.parse_args()
+
+    PDFS_DIR.mkdir(parents=True, exist_ok=True)
+    engine = create_engine(args.database_url)
+    init_db(engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    # Hold the same one-import-at-a-time slot as admin import jobs for the whole run
+    job_db = SessionLocal()
+    try:
+        job = claim_import_job(job_db, pid=os.getpid())
+    except ImportAlreadyRunning:
+        print("Error: An import is already running")
+        sys.exit(1)
+    job.status = "running"
+    job_db.commit()
+
+    db_session = SessionLocal()
+    throttle = Throttle(IMPORT_MAX_BATCHES_PER_SECOND)
+    # spawn, as for import jobs: forking while the stage threads run can deadlock
+    extract_pool = ProcessPoolExecutor(max_workers=args.extract_workers,
+                                       mp_context=multiprocessing.get_context("spawn"))
+
+    def download(url):
+        county = COUNTY_NAMES.get(extract_county_code(url))
+        if not county:
+            print(f"Warning: Unknown county in {url}")
+            return None
+        output_path = PDFS_DIR / f"{county}.pdf"
+        # Download next to the target and rename, so readers never see a partial PDF
+        tmp_path = output_path.with_name(output_path.name + ".part")
+        if not download_pdf(url, tmp_path):
+            tmp_path.unlink(missing_ok=True)
+            return None
+        os.replace(tmp_path, output_path)
+        return output_path
+
+    def extract(pdf_path):
+        rows = extract_pool.submit(extract_rows, pdf_path).result()
+        print(f"Extracted: {pdf_path.name} ({len(rows or [])} rows)")
+        return (get_county_from_filename(pdf_path.name), rows) if rows else None
+
+    totals = {"imported": 0, "errors": 0}
+
+    def write(item):
+        county, rows = item
+        imported, errors = write_rows(rows, db_session, county, throttle=throttle)
+        totals["imported"] += imported
+        totals["errors"] += errors
+        print(f"Imported: {county} ({imported} rows, {errors} errors)")
+        return True
+
+    sources = queue.Queue()
+    downloaded = queue.Queue(maxsize=args.queue_size)
+    extracted = queue.Queue(maxsize=args.queue_size)
+
+    if args.skip_download:
+        first_stage = Stage("list", lambda path: path, 1, sources, downloaded)
+        inputs = sorted(PDFS_DIR.glob("*.pdf"))
+    else:
+        first_stage = Stage("download", download, args.download_workers, sources, downloaded)
+        inputs = URLS
+    stages = pipeline(
+        first_stage,
+        Stage("extract", extract, args.extract_workers, downloaded, extracted),
+        Stage("write", write, 1, extracted),
+    )
+    for item in inputs:
+        sources.put(item)
+    for _ in range(stages[0].workers):
+        sources.put(DONE)
+
+    start = time.perf_counter()
+    error = None
+    try:
+        with Heartbeat(SessionLocal, job.id):
+            for stage in stages:
+                stage.start()
+            stages[-1].join()
+    except BaseException:
+        error = traceback.format_exc(limit=5)
+        raise
+    finally:
+        extract_pool.shutdown()
+        db_session.close()
+        finish_import_job(job_db, job, error)
+        job_db.close()
+    elapsed = time.perf_counter() - start
+    prune_word_cache(PDFS_DIR)
+
+    print(f"\nRefresh complete in {elapsed:.1f}s: {totals['imported']} monuments imported, "
+          f"{totals['errors']} errors\n")
+    print(f"{'stage':<10} {'workers':>7} {'items':>6} {'failed':>6} {'items/s':>8} "
+          f"{'busy_s':>9} {'idle_in_s':>10} {'blocked_out_s':>12}")
+    for stage in stages:
+        print(stage.report(elapsed))
+
+
+if __name__ == "__main__":
+    main()
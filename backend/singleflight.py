@@ -0,0 +1,55 @@
+"""Request coalescing (single-flight) for identical concurrent queries.
+
+Concurrent callers asking for the same key share one in-flight execution and
+its result instead of each hitting the database.
+"""
+
+import asyncio
+from starlette.concurrency import run_in_threadpool
+
+
+class TooManyWaiters(Exception):
+    """Raised when a key already has the maximum number of waiting callers."""
+
+
+class SingleFlight:
+    """Share one execution of a blocking function between concurrent callers of the same key."""
+
+    def __init__(self, max_waiters: int = 1000, timeout: float = 10.0):
+        self.max_waiters = max_waiters
+        self.timeout = timeout
+        self.calls = {}  # key -> [future, waiter count]
+        self.stats = {"executed": 0, "coalesced": 0, "rejected": 0, "timeouts": 0}
+
+    async def do(self, key, fn, *args):
+        """Return fn(*args), run in a worker thread, or join an identical call already in flight.
+
+        Raises TooManyWaiters if the key is saturated and asyncio.TimeoutError if
+        the result isn't ready within the timeout. A timed-out caller doesn't
+        cancel the execution; other waiters still get its result.
+        """
+        call = self.calls.get(key)
+        if call is None:
+            future = asyncio.ensure_future(run_in_threadpool(fn, *args))
+            call = self.calls[key] = [future, 0]
+            future.add_done_callback(lambda _: self.calls.pop(key, None))
+            self.stats["executed"] += 1
+        else:
+            if call[1] >= self.max_waiters:
+                self.stats["rejected"] += 1
+                raise TooManyWaiters()
+            self.stats["coalesced"] += 1
+
+        call[1] += 1
+        try:
+            # shield so a waiter timing out doesn't cancel the shared execution
+            return await asyncio.wait_for(asyncio.shield(call[0]), self.timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            raise
+        finally:
+            call[1] -= 1
+
+    def metrics(self) -> dict:
+        """Counters plus the number of executions currently in flight."""
+        return {**self.stats, "in_flight": len(self.calls)}
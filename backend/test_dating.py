@@ -0,0 +1,62 @@
+"""Table-driven checks of parse_dating against Datare values from the database backup."""
+
+import pytest
+
+from dating import CONFIDENCE_HIGH, CONFIDENCE_LOW, parse_dating
+
+
+@pytest.mark.parametrize("dating, expected", [
+    # Explicit years
+    ("1912", (1912, 1912, CONFIDENCE_HIGH)),
+    ("1850 - 1900", (1850, 1900, CONFIDENCE_HIGH)),
+    ("1926 – 1928", (1926, 1928, CONFIDENCE_HIGH)),
+    ("cca. 1900", (1900, 1900, CONFIDENCE_LOW)),
+    ("de 1850 - 1900", (1850, 1900, CONFIDENCE_HIGH)),
+    # Centuries, with qualifiers and hyphen or en dash ranges
+    ("sec. XVIII", (1701, 1800, CONFIDENCE_LOW)),
+    ("sf. sec. XIX", (1867, 1900, CONFIDENCE_LOW)),
+    ("mijl. sec. XIX", (1834, 1867, CONFIDENCE_LOW)),
+    ("sec. XVIII - XIX", (1701, 1900, CONFIDENCE_LOW)),
+    ("sec. XVII-XIX", (1601, 1900, CONFIDENCE_LOW)),
+    ("sec. XVI – XVIII, Epoca medievală", (1501, 1800, CONFIDENCE_LOW)),
+    ("sec. XVII – XVIII", (1601, 1800, CONFIDENCE_LOW)),
+    ("sec. XI – XII, Epoca medieval timpurie", (1001, 1200, CONFIDENCE_LOW)),
+    ("sec. XIV - XV, XVI – XVII, Epoca medievală", (1301, 1700, CONFIDENCE_LOW)),
+    ("sec. XlX", (1801, 1900, CONFIDENCE_LOW)),
+    # Before / after Christ
+    ("sec. II - III p. Chr., Epoca romană", (101, 300, CONFIDENCE_LOW)),
+    ("sec. II – III p.Chr., Epoca romană", (101, 300, CONFIDENCE_LOW)),
+    ("sec. I a. Chr. - I p. Chr., Latène, Cultura geto - dacică", (-100, 100, CONFIDENCE_LOW)),
+    ("sec. IV a. Chr. - sec. II p. Chr., Latène, Cultura geto - dacică", (-400, 200, CONFIDENCE_LOW)),
+    ("sec. II-I. a. Chr., şi în Latène, Cultura geto-dacică", (-200, -1, CONFIDENCE_LOW)),
+    # Years with an era marker
+    ("1800 - 800 a. Chr., Epoca bronzului", (-1800, -800, CONFIDENCE_HIGH)),
+    ("3700 - 1800 a. Chr., Neolitic, Cultura Sălcuţa", (-3700, -1800, CONFIDENCE_HIGH)),
+    ("1600 a. Chr, Epoca bronzului", (-1600, -1600, CONFIDENCE_HIGH)),
+    ("la 2500 - 1800 a. Chr., Epoca bronzului timpuriu, Cultura Horodiştea - Folteşti",
+     (-2500, -1800, CONFIDENCE_HIGH)),
+    ("10000 - 5000 a. Chr., Paleolitic", (-10000, -5000, CONFIDENCE_HIGH)),
+    ("101 - 118 p. Chr.", (101, 118, CONFIDENCE_HIGH)),
+    # Year-like numbers left unparsed
+    ("1800 - 800", (1800, 1800, CONFIDENCE_LOW)),
+    ("283 1877", (1877, 1877, CONFIDENCE_LOW)),
+    # Centuries without "sec."
+    ("IX - XI", (801, 1100, CONFIDENCE_LOW)),
+    ("XVI - XVIII", (1501, 1800, CONFIDENCE_LOW)),
+    ("III - IV p. Chr.", (201, 400, CONFIDENCE_LOW)),
+    ("XIX", (1801, 1900, CONFIDENCE_LOW)),
+    # Centuries combined with years
+    ("sec. XVIII, ext. 1820", (1701, 1820, CONFIDENCE_LOW)),
+    ("înc. sec. XVIII, ref. 1730 şi 1773", (1701, 1773, CONFIDENCE_LOW)),
+    # Archaeological periods
+    ("Neolitic, Cultura Petreşti", (-6500, -3700, CONFIDENCE_LOW)),
+    ("Eneolitic final, cultura Horodiştea – Erbiceni", (-3700, -2500, CONFIDENCE_LOW)),
+    ("Hallstat", (-1150, -450, CONFIDENCE_LOW)),
+    ("Epoca migraţiilor", (275, 1000, CONFIDENCE_LOW)),
+    # Extraction debris
+    ("de", (None, None, None)),
+    ("m V", (None, None, None)),
+    (None, (None, None, None)),
+])
+def test_parse_dating(dating, expected):
+    assert parse_dating(dating) == expected
@@ -0,0 +1,158 @@
+"""On-disk cache of pdfplumber word boxes, so column tuning doesn't re-parse PDFs.
+
+page.extract_words() is the expensive part of extraction and doesn't depend on
+COLUMN_COORDS, so its output (text, x0, top per word) is stored per PDF content
+hash, page number and crop box:
+
+    <cache_dir>/<version>/<sha256 of pdf>/meta.json                    page sizes
+    <cache_dir>/<version>/<sha256 of pdf>/<page>_<l>_<t>_<r>_<b>.words  word boxes
+
+<version> covers the file format, the pdfplumber version and the extract_words()
+options, so upgrading pdfplumber or changing the options starts a fresh cache.
+prune_word_cache() removes other versions and entries for PDFs no longer in pdfs/.
+
+A .words file is zlib-compressed and columnar: a header (magic, word count),
+all x0 values as float64, all top values as float64, then the texts joined by NUL.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import struct
+import zlib
+from array import array
+from pathlib import Path
+import pdfplumber
+
+WORD_CACHE_DIR = Path(__file__).parent / ".word_cache"
+
+MAGIC = b"WRD1"
+HEADER = struct.Struct("<4sI")
+
+EXTRACT_WORDS_OPTIONS = {}  # passed to page.extract_words()
+CACHE_VERSION = "{}-pdfplumber{}-{}".format(
+    MAGIC.decode(),
+    pdfplumber.__version__,
+    hashlib.sha256(json.dumps(EXTRACT_WORDS_OPTIONS, sort_keys=True).encode()).hexdigest()[:8],
+)
+
+
+def file_sha256(path: Path) -> str:
+    """Hash a file's content in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def encode_words(words: list) -> bytes:
+    """Serialize word dicts (text, x0, top) to the compressed columnar format."""
+    x0 = array("d", (w["x0"] for w in words))
+    top = array("d", (w["top"] for w in words))
+    texts = "\0".join(w["text"] for w in words).encode("utf-8")
+    return zlib.compress(HEADER.pack(MAGIC, len(words)) + x0.tobytes() + top.tobytes() + texts)
+
+
+def decode_words(data: bytes) -> list:
+    """Inverse of encode_words."""
+    data = zlib.decompress(data)
+    magic, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a word cache file")
+    offset = HEADER.size
+    x0 = array("d")
+    x0.frombytes(data[offset:offset + 8 * count])
+    offset += 8 * count
+    top = array("d")
+    top.frombytes(data[offset:offset + 8 * count])
+    offset += 8 * count
+    texts = data[offset:].decode("utf-8").split("\0") if count else []
+    return [{"text": t, "x0": x, "top": y} for t, x, y in zip(texts, x0, top)]
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file so an interrupted run never leaves a truncated cache entry."""
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def prune_word_cache(pdfs_dir: Path, cache_dir: Path = WORD_CACHE_DIR) -> int:
+    """Delete cache entries of other versions or of PDFs no longer in pdfs_dir.
+
+    Returns the number of entries removed.
+    """
+    cache_dir = Path(cache_dir)
+    if not cache_dir.exists():
+        return 0
+    keep = {file_sha256(path) for path in Path(pdfs_dir).glob("*.pdf")}
+    removed = 0
+    for version_dir in cache_dir.iterdir():
+        if version_dir.name != CACHE_VERSION:
+            shutil.rmtree(version_dir, ignore_errors=True)
+            removed += 1
+            continue
+        for entry_dir in version_dir.iterdir():
+            if entry_dir.name not in keep:
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                removed += 1
+    return removed
+
+
+class PageWords:
+    """Page sizes and cropped word boxes of a PDF, served from the cache when possible.
+
+    The PDF is only opened with pdfplumber on a cache miss. Pass cache_dir=None
+    to always read from the PDF.
+    """
+
+    def __init__(self, pdf_path: Path, cache_dir: Path = WORD_CACHE_DIR):
+        self.pdf_path = Path(pdf_path)
+        self.pdf = None
+        self.entry_dir = None
+        if cache_dir is not None:
+            self.entry_dir = Path(cache_dir) / CACHE_VERSION / file_sha256(self.pdf_path)
+            self.entry_dir.mkdir(parents=True, exist_ok=True)
+        self.page_sizes = self.load_page_sizes()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.pdf is not None:
+            self.pdf.close()
+
+    def open_pdf(self):
+        if self.pdf is None:
+            self.pdf = pdfplumber.open(self.pdf_path)
+        return self.pdf
+
+    def load_page_sizes(self) -> list:
+        meta_path = self.entry_dir / "meta.json" if self.entry_dir else None
+        if meta_path and meta_path.exists():
+            return json.loads(meta_path.read_text())["page_sizes"]
+        page_sizes = [[page.width, page.height] for page in self.open_pdf().pages]
+        if meta_path:
+            write_atomic(meta_path, json.dumps({"page_sizes": page_sizes}).encode())
+        return page_sizes
+
+    @property
+    def num_pages(self) -> int:
+        return len(self.page_sizes)
+
+    def words(self, page_num: int, bbox: tuple) -> list:
+        """Return extract_words() output (text, x0, top) for a page cropped to bbox."""
+        cache_path = None
+        if self.entry_dir:
+            key = "_".join(f"{v:.3f}" for v in bbox)
+            cache_path = self.entry_dir / f"{page_num}_{key}.words"
+            if cache_path.exists():
+                return decode_words(cache_path.read_bytes())
+
+        page = self.open_pdf().pages[page_num].crop(bbox)
+        words = [{"text": w["text"], "x0": w["x0"], "top": w["top"]} for w in page.extract_words(**EXTRACT_WORDS_OPTIONS)]
+        if cache_path:
+            write_atomic(cache_path, encode_words(words))
+        return words